@@ -292,10 +292,13 @@ class SQLRepo(TemplateRepo):
 
     def _filter_orm(self, query):
         session = self.session
-        return session.query(self.model_orm).filter(query)
+        qry = session.query(self.model_orm)
+        if query is not None:
+            qry = qry.filter(query)
+        return qry
 
     def format_query(self, oper: dict):
-        return to_expression(oper, table=self.model_orm)
+        return to_expression(oper, table=self.model_orm, dialect=self.session.get_bind().dialect.name)
 
     def _create_table(self, session, model, name, primary_column=None):
         table = Table(bind=session.get_bind(), name=name)
@@ -317,6 +320,8 @@ class SQLExprRepo(TemplateRepo):
             raise KeyFoundError(f"Inserting item {self.get_field_value(item, self.id_field)} failed.") from exc
 
     def query_data(self, query):
+        # Rows are read before yielding so that the repo
+        # can be written while iterating (ie. on SQLite)
         for data in self.object.select(query):
             yield data
 
@@ -1,9 +1,8 @@
 
-from copy import copy
 import datetime
-from functools import partial
+from functools import lru_cache
 import sys
-from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, Union
 from pathlib import Path
 import typing
 
@@ -150,6 +149,8 @@ class Table:
     } if import_exists("sqlalchemy") else {}
     _name: str
     _object: 'sqlalchemy.Table'
+    _types_cache: Optional[Dict[str, Callable]]
+    _select_cache: Dict[Optional[Tuple[str, ...]], 'sqlalchemy.sql.Select']
 
     class _trans_ctx:
         # Utility for transaction context manager
@@ -157,7 +158,10 @@ class Table:
             self.obj = obj
 
         def __enter__(self):
-            new_table = copy(self.obj)
+            # Shallow copy without copy.copy's reduce protocol.
+            # The cached column information is shared
+            new_table = object.__new__(type(self.obj))
+            new_table.__dict__.update(self.obj.__dict__)
             new_table._ctx = None
             self._ctx = new_table.bind.begin()
             new_table.bind = self._ctx.__enter__()
@@ -183,13 +187,11 @@ class Table:
                 # "execute" should return Results that are still open
                 return self.obj.execute(*self.args, **self.kwargs)
             else:
+                # Reads need no transaction, executing on
+                # a plain connection is enough
                 self._conn = bind.connect()
                 self._conn.__enter__()
-
-                new_table = copy(self.obj)
-                new_table.bind = self._conn
-
-                return new_table.execute(*self.args, **self.kwargs)
+                return _execute(self._conn, *self.args, **self.kwargs)
 
         def __exit__(self, type_, value, traceback):
             if hasattr(self, "_conn"):
@@ -331,38 +333,75 @@ class Table:
                 parameters={"myparam": "a value"}
             )
         """
+        statement = self._to_select_statement(qry, columns=columns, parameters=parameters)
+        with self.execution(statement) as results:
+            return list(self._format_rows(results))
+
+    def iter_select(self, qry:Union[str, dict, 'sqlalchemy.sql.ClauseElement', None]=None, columns:Optional[List[str]]=None, parameters:Optional[Dict]=None) -> Iterator[dict]:
+        """Iterate the rows of the database table using a query.
+
+        Same as :py:meth:`redbird.sql.Table.select` except that
+        the rows are streamed (using server side cursor if the
+        dialect supports it) instead of fetching all of them to
+        memory. The connection is kept open until the iteration
+        is finished or the iterator is closed.
+
+        Parameters
+        ----------
+        qry : str, dict, sqlalchemy.sql.ClauseElement, optional
+            Query to filter the data. See :py:meth:`redbird.sql.Table.select`.
+        columns : list of string, optional
+            List of columns to return. By default returns all columns.
+        parameters : dict, optional
+            Parameters for the query.
+
+        Yields
+        ------
+        dict
+            Found rows as dicts.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            for row in table.iter_select({"column_1": "a value"}):
+                ...
+        """
+        statement = self._to_select_statement(qry, columns=columns, parameters=parameters)
+        if isinstance(statement, str):
+            statement = sqlalchemy.text(statement)
+        statement = statement.execution_options(stream_results=True)
+        with self.execution(statement) as results:
+            yield from self._format_rows(results)
+
+    def _to_select_statement(self, qry, columns=None, parameters=None):
+        "Turn query to select statement"
         if isinstance(qry, Path):
             qry = qry.read_text()
-        elif qry is None:
-            qry = sqlalchemy.true()
 
         if isinstance(qry, dict):
-            qry = to_expression(qry)
+            qry = self._to_expression(qry)
         if isinstance(qry, str):
+            if parameters is None:
+                # Raw SQL is turned to a statement
+                # on execution if needed (see _execute)
+                return qry
             statement = sqlalchemy.text(qry)
         elif isinstance(qry, (sqlalchemy.sql.Selectable, sqlalchemy.sql.elements.TextClause)):
             statement = qry
         else:
-            if columns is None:
-                columns = ()
-            else:
-                columns = [
-                    self.object.columns[col]
-                    for col in columns
-                ]
-            where = qry
-            statement = self.object.select(*columns)
-            statement = statement.where(where)
-            statement = statement.select_from(self.object)
+            statement = self._get_select_statement(None if not columns else tuple(columns))
+            if qry is not None:
+                statement = statement.where(qry)
 
         if parameters is not None:
             statement = statement.bindparams(**parameters)
+        return statement
 
-        with self.execution(statement) as results:
-            rows = results.mappings()
-            if self.name is not None:
-                rows = self._format_results(rows)
-            return list(rows)
+    def _format_rows(self, results) -> Iterable[dict]:
+        if self.name is None:
+            return results.mappings()
+        return self._format_results(results)
     
     def insert(self, data:Union[Mapping, List[dict]]):
         """Insert data to the database.
@@ -370,7 +409,8 @@ class Table:
         Parameters
         ----------
         data : dict, list of dicts
-            Data to be inserted.
+            Data to be inserted. List of dicts is
+            inserted in one execution (executemany).
 
         Examples
         --------
@@ -388,13 +428,23 @@ class Table:
                 {"column_1": "a", "column_2": 1},
                 {"column_1": "b", "column_2": 2},
             ])
+
+        .. note::
+
+            Some drivers can turn inserting multiple rows to a single
+            ``INSERT ... VALUES`` statement. For example, this is
+            configured for psycopg2 with ``executemany_mode``:
+
+            .. code-block:: python
+
+                create_engine(..., executemany_mode="values_plus_batch")
         """
         table = self.object
         if isinstance(data, Mapping):
             statement = table.insert().values(**data)
             self.execute(statement)
-        else:
-            self.execute(sqlalchemy.insert(self.object), data)
+        elif data:
+            self.execute(sqlalchemy.insert(table), data)
 
     def delete(self, where:Union[dict, 'sqlalchemy.sql.ClauseElement']) -> int:
         """Delete row(s) from the table.
@@ -450,10 +500,7 @@ class Table:
             table.delete({})
 
         """
-        if isinstance(where, dict):
-            where = to_expression(where)
-        table = self.object
-        statement = table.delete().where(where)
+        statement = self._add_where(self.object.delete(), where)
         result = self.execute(statement)
         return result.rowcount
 
@@ -516,10 +563,7 @@ class Table:
             table.update({}, {"column_3": "new value"})
 
         """
-        if isinstance(where, dict):
-            where = to_expression(where)
-        table = self.object
-        statement = table.update().where(where).values(values)
+        statement = self._add_where(self.object.update(), where).values(values)
         result = self.execute(statement)
         return result.rowcount
 
@@ -547,61 +591,89 @@ class Table:
         """
         stmt = sqlalchemy.select(sqlalchemy.func.count()).select_from(self.object)
         if where is not None:
-            if isinstance(where, dict):
-                where = to_expression(where)
-            stmt = stmt.where(where)
+            stmt = self._add_where(stmt, where)
 
         with self.execution(stmt) as results:
-            return results.scalar_one()
+            return results.scalar()
+
+    def _to_expression(self, qry:dict):
+        return to_expression(qry, dialect=self.bind.dialect.name)
 
-    def _format_results(self, res:Iterable[Tuple]) -> Iterable[dict]:
-        columns = self._get_types()
+    def _add_where(self, statement, where:Union[dict, 'sqlalchemy.sql.ClauseElement']):
+        "Add where clause to a statement"
+        if isinstance(where, dict):
+            where = self._to_expression(where)
+            if where is None:
+                # Nothing to filter
+                return statement
+        return statement.where(where)
+
+    def _format_results(self, res:'sqlalchemy.engine.Result') -> Iterable[dict]:
+        types = self._get_types()
+        # Rows are accessed by position (faster than by key)
+        # thus the names and converters are in the order of
+        # the result's columns
+        names = tuple(res.keys())
+        # Only the columns that need conversion are converted
+        to_convert = tuple(
+            (name, types[name])
+            for name in names
+            if types.get(name, _identity) is not _identity
+        )
+        if not to_convert:
+            return (dict(zip(names, row)) for row in res)
+        return self._convert_rows(res, names, to_convert)
+
+    @staticmethod
+    def _convert_rows(res, names:Tuple[str, ...], to_convert:Tuple[Tuple[str, Callable], ...]) -> Iterator[dict]:
         for row in res:
-            row = {name: conv(row[name]) for name, conv in columns.items()}
-            yield row
+            data = dict(zip(names, row))
+            for name, conv in to_convert:
+                data[name] = conv(data[name])
+            yield data
 
     def _get_types(self) -> Dict[str, Callable]:
         "Get table's column types"
-        cols = dict(self.object.columns)
-        return {col_name: partial(to_native, sql_type=col.type, nullable=col.nullable) for col_name, col in cols.items()}
+        if self._types_cache is None:
+            dialect = self.bind.dialect.name
+            self._types_cache = {
+                col_name: _get_converter(col.type, nullable=col.nullable, dialect=dialect)
+                for col_name, col in self.object.columns.items()
+            }
+        return self._types_cache
+
+    def _get_select_statement(self, columns:Optional[Tuple[str, ...]]=None) -> 'sqlalchemy.sql.Select':
+        "Get statement selecting given columns (or all if None) of the table"
+        # Statements are immutable (methods return copies)
+        # so the same statement can be reused for each select
+        statement = self._select_cache.get(columns)
+        if statement is None:
+            tbl = self.object
+            if columns is None:
+                statement = tbl.select()
+            else:
+                col_map = tbl.columns
+                statement = sqlalchemy.select(*[col_map[col] for col in columns])
+            statement = statement.select_from(tbl)
+            if len(self._select_cache) < 128:
+                self._select_cache[columns] = statement
+        return statement
+
+    def _clear_cache(self):
+        # Clear cached information about the table's columns
+        self._types_cache = None
+        self._select_cache = {}
 
     def _to_sqlalchemy_type(self, cls):
         from sqlalchemy.sql import sqltypes
         if isinstance(cls, sqltypes.TypeEngine):
             return cls
-        is_older_py = sys.version_info < (3, 8)
-        origin = typing.get_origin(cls) if not is_older_py else None
-        if origin is not None:
-            # In form: 
-            # - Literal['', '']
-            # - Optional[...]
-            args = typing.get_args(cls)
-            if origin is typing.Union:
-                # Either:
-                # - Union[...]
-                # - Optional[...]
-                # Only Union[<TYPE>, NoneType] is allowed
-                none_type = type(None)
-                has_none_type = none_type in args
-                if len(args) > 2 or (len(args) == 2 and not has_none_type):
-                    raise TypeError(f"Union has more than one optional type: {str(cls)}. Cannot define SQL data type")
-                # Get the non-None type
-                for arg in args:
-                    if arg is not none_type:
-                        cls = arg
-                        break
-            
-            if origin is Literal:
-                type_ = type(args[0])
-                for arg in args[1:]:
-                    if not isinstance(arg, type_):
-                        raise TypeError(f"Literal values are not same types: {str(cls)}. Cannot define SQL data type")
-                cls = type_
-        return self.types.get(cls)
+        return self.types.get(_resolve_python_type(cls))
 
     def reflect(self):
         """Reflect the table from the database."""
         self._object = reflect_table(self.name, bind=self.bind)
+        self._clear_cache()
 
     def drop(self):
         """Drop the table."""
@@ -688,10 +760,12 @@ class Table:
 
         if exist_ok and self.exists():
             self._object = tbl
+            self._clear_cache()
             return
 
         tbl.create(bind=self.bind)
         self._object = tbl
+        self._clear_cache()
 
     def create_from_model(self, model:BaseModel, primary_column=None):
         if isinstance(primary_column, str):
@@ -718,16 +792,12 @@ class Table:
         **args : dict
             Passed directly to sqlalchemy.Connection.execute.
         """
-        if len(args) == 1 and isinstance(args[0], str):
-            # SQLAlchemy v2.0 won't accept string as 
-            # expression but we do
-            args = (sqlalchemy.text(*args),)
         conn = self.bind
         if isinstance(conn, sqlalchemy.engine.Engine):
             with conn.begin() as conn:
-                return conn.execute(*args, **kwargs)
+                return _execute(conn, *args, **kwargs)
         else:
-            return conn.execute(*args, **kwargs)
+            return _execute(conn, *args, **kwargs)
 
     def open_transaction(self):
         """Open a transaction.
@@ -804,6 +874,7 @@ class Table:
     def object(self, value: 'sqlalchemy.Table'):
         self._object = value
         self._name = value.name
+        self._clear_cache()
 
     @property
     def name(self) -> str:
@@ -816,6 +887,7 @@ class Table:
     def name(self, value: str):
         self._name = value
         self._object = None
+        self._clear_cache()
 
 
 def to_native(value, sql_type, nullable=False):
@@ -831,6 +903,91 @@ def to_native(value, sql_type, nullable=False):
         return value
     return py_type(value)
 
+@lru_cache(maxsize=None)
+def _resolve_python_type(cls):
+    "Resolve the actual type of optionals, unions and literals (ie. Optional[int] --> int)"
+    is_older_py = sys.version_info < (3, 8)
+    origin = typing.get_origin(cls) if not is_older_py else None
+    if origin is not None:
+        # In form: 
+        # - Literal['', '']
+        # - Optional[...]
+        args = typing.get_args(cls)
+        if origin is typing.Union:
+            # Either:
+            # - Union[...]
+            # - Optional[...]
+            # Only Union[<TYPE>, NoneType] is allowed
+            none_type = type(None)
+            has_none_type = none_type in args
+            if len(args) > 2 or (len(args) == 2 and not has_none_type):
+                raise TypeError(f"Union has more than one optional type: {str(cls)}. Cannot define SQL data type")
+            # Get the non-None type
+            for arg in args:
+                if arg is not none_type:
+                    cls = arg
+                    break
+
+        if origin is Literal:
+            type_ = type(args[0])
+            for arg in args[1:]:
+                if not isinstance(arg, type_):
+                    raise TypeError(f"Literal values are not same types: {str(cls)}. Cannot define SQL data type")
+            cls = type_
+    return cls
+
+def _identity(value):
+    # Converter for columns that need no conversion
+    return value
+
+def _get_converter(sql_type, nullable=False, dialect:Optional[str]=None) -> Callable:
+    "Get function that converts values of given sql type to Python native (same as to_native)."
+    try:
+        py_type = sql_type.python_type
+    except NotImplementedError:
+        # Type has no Python counterpart (ie. SQLite column
+        # without a type), values are returned as they are
+        return _identity
+
+    if py_type is datetime.datetime or py_type is datetime.date:
+        if dialect is not None and dialect != "sqlite":
+            # Only SQLite may return dates as strings,
+            # other drivers return them as dates
+            return _identity
+        from_isoformat = py_type.fromisoformat
+    else:
+        from_isoformat = None
+
+    def convert(value):
+        # Comparing the class first is faster than isinstance
+        if value.__class__ is py_type or isinstance(value, py_type):
+            return value
+        elif from_isoformat is not None and isinstance(value, str):
+            return from_isoformat(value)
+        if nullable and value is None:
+            return value
+        return py_type(value)
+    return convert
+
+def _execute(conn:'sqlalchemy.engine.Connection', *args, **kwargs):
+    "Execute SQL statement or raw SQL using a connection"
+    if len(args) == 1 and isinstance(args[0], str):
+        sql = args[0]
+        if not kwargs and _is_driver_sql(sql):
+            # No parameters, SQLAlchemy's text
+            # clause is not needed
+            return conn.exec_driver_sql(sql)
+        # SQLAlchemy v2.0 won't accept string as 
+        # expression but we do
+        args = (sqlalchemy.text(sql),)
+    return conn.execute(*args, **kwargs)
+
+def _is_driver_sql(sql:str) -> bool:
+    # Raw SQL can be passed as is to the driver if it
+    # has no parameters (":myparam") nor anything the
+    # driver may interpret as such ("%s", "%(myparam)s")
+    return ":" not in sql and "%" not in sql
+
 def create_table(*args, bind:'Engine', table:str, **kwargs):
     """Create a table to a SQL database.
     
@@ -950,16 +1107,55 @@ def execute(*args, bind:'Engine', **kwargs):
     return Table(bind=bind, name=None).execute(*args, **kwargs)
 
 
-def to_expression(qry:dict, table=None):
-    stmt = sqlalchemy.true()
+@lru_cache(maxsize=4096)
+def _get_column(name:str) -> 'Column':
+    # The column is not bound to a table thus
+    # it can be shared between the expressions
+    return sqlalchemy.Column(name)
+
+def _to_in(column, oper:In, dialect:Optional[str]=None):
+    if dialect == "postgresql":
+        # Pass the values as one array so that the statement
+        # is the same regardless of the number of the values
+        from sqlalchemy.dialects.postgresql import ARRAY
+        type_ = None if isinstance(column.type, sqlalchemy.types.NullType) else ARRAY(column.type)
+        return column == sqlalchemy.any_(sqlalchemy.literal(list(oper.value), type_=type_))
+    return column.in_(oper.value)
+
+_OPER_BUILDERS = {
+    # Operations that have no Python magic counterpart in SQLAlchemy
+    Between: lambda column, oper, dialect=None: column.between(oper.start, oper.end),
+    In: _to_in,
+}
+
+# Resolved builders by the type of the operation
+# (None if the operation has no builder)
+_OPER_BUILDER_CACHE: Dict[type, Optional[Callable]] = {}
+
+def _get_oper_builder(oper:Operation) -> Optional[Callable]:
+    oper_type = type(oper)
+    builder = _OPER_BUILDERS.get(oper_type)
+    if builder is None:
+        # Subclasses of the operations
+        for cls, cls_builder in _OPER_BUILDERS.items():
+            if isinstance(oper, cls):
+                builder = cls_builder
+                break
+    _OPER_BUILDER_CACHE[oper_type] = builder
+    return builder
+
+def to_expression(qry:dict, table=None, dialect:Optional[str]=None) -> Optional['sqlalchemy.sql.ClauseElement']:
+    clauses = []
     for column_name, oper_or_value in qry.items():
-        column = getattr(table, column_name) if table is not None else sqlalchemy.Column(column_name)
+        column = getattr(table, column_name) if table is not None else _get_column(column_name)
         if isinstance(oper_or_value, Operation):
             oper = oper_or_value
-            if isinstance(oper, Between):
-                sql_oper = column.between(oper.start, oper.end)
-            elif isinstance(oper, In):
-                sql_oper = column.in_(oper.value)
+            try:
+                builder = _OPER_BUILDER_CACHE[type(oper)]
+            except KeyError:
+                builder = _get_oper_builder(oper)
+            if builder is not None:
+                sql_oper = builder(column, oper, dialect=dialect)
             elif oper is skip:
                 continue
             elif hasattr(oper, "__py_magic__"):
@@ -981,9 +1177,15 @@ def to_expression(qry:dict, table=None):
             elif stop is not None:
                 sql_oper = column <= stop
             else:
-                sql_oper = sqlalchemy.true()
+                # Open from both ends, nothing to filter
+                continue
         else:
             value = oper_or_value
             sql_oper = column == value
-        stmt &= sql_oper
-    return stmt
\ No newline at end of file
+        clauses.append(sql_oper)
+    if not clauses:
+        # Nothing to filter
+        return None
+    # Combining once instead of one by one avoids
+    # rebuilding the clause list for each item
+    return sqlalchemy.and_(*clauses)
\ No newline at end of file
@@ -350,4 +350,19 @@ def test_init_create_table():
     assert issubclass(repo.model, BaseModel)
 
     repo.add({"id": "a", "name": "Jack", "age": 500})
-    assert list(repo) == [MyItem(id="a", name="Jack", age=500)]
\ No newline at end of file
+    assert list(repo) == [MyItem(id="a", name="Jack", age=500)]
+
+def test_update_while_iterating(tmpdir):
+    pytest.importorskip("sqlalchemy")
+    from sqlalchemy import create_engine
+    from redbird.repos import SQLExprRepo
+    engine = create_engine(f'sqlite:///{tmpdir}/testing.db')
+    repo = SQLExprRepo(model=MyItem, engine=engine, table="mytable", id_field="id")
+    repo.create()
+    repo.add(MyItem(id="a", name="Jack", age=20))
+    repo.add(MyItem(id="b", name="John", age=30))
+
+    for item in repo.filter_by():
+        repo.filter_by(id=item.id).update(age=item.age + 1)
+
+    assert list(repo) == [MyItem(id="a", name="Jack", age=21), MyItem(id="b", name="John", age=31)]
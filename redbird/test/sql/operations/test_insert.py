@@ -27,4 +27,9 @@ def test_insert_list_dicts(engine):
     assert [
         {'id': 'a', 'name': 'Johnny', 'birth_date': '2000-01-01', 'score': 100}, 
         {'id': 'b', 'name': 'James', 'birth_date': '2020-01-01', 'score': 200},
-    ] == list(select("select * from empty", bind=engine))
\ No newline at end of file
+    ] == list(select("select * from empty", bind=engine))
+
+def test_insert_empty_list(engine):
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    insert([], table="empty", bind=engine)
+    assert [] == list(select("select * from empty", bind=engine))
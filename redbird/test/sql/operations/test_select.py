@@ -138,4 +138,52 @@ def test_select_expr(engine):
         #{'id': 'a', 'name': 'Jack', 'birth_date': '2000-01-01', 'score': 100},
         #{'id': 'b', 'name': 'John', 'birth_date': '1990-01-01', 'score': 200},
         {'id': 'c', 'name': 'James', 'birth_date': date(2020, 1, 1), 'score': 300},
-    ] == list(results)
\ No newline at end of file
+    ] == list(results)
+
+def test_select_untyped(engine):
+    import sqlalchemy
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("CREATE TABLE untyped (id, name)"))
+        conn.execute(sqlalchemy.text("INSERT INTO untyped (id, name) VALUES ('a', 'Jack'), (1, 2)"))
+    results = select(table="untyped", bind=engine)
+    assert [
+        {'id': 'a', 'name': 'Jack'},
+        {'id': 1, 'name': 2},
+    ] == results
+
+def test_select_columns(engine):
+    tbl = Table("populated", bind=engine)
+    for _ in range(2):
+        results = tbl.select({"name": "Jack"}, columns=["name", "birth_date"])
+        assert [
+            {'name': 'Jack', 'birth_date': date(2000, 1, 1)},
+        ] == results
+    assert [{'score': 100}, {'score': 200}, {'score': 300}] == tbl.select(columns=["score"])
+    # Empty columns are considered as all columns
+    assert [
+        {'id': 'a', 'name': 'Jack', 'birth_date': date(2000, 1, 1), 'score': 100},
+    ] == tbl.select({"name": "Jack"}, columns=[])
+
+def test_iter_select(engine):
+    tbl = Table("populated", bind=engine)
+    results = tbl.iter_select({"score": between(100, 200)})
+    assert not isinstance(results, list)
+    assert [
+        {'id': 'a', 'name': 'Jack', 'birth_date': date(2000, 1, 1), 'score': 100},
+        {'id': 'b', 'name': 'John', 'birth_date': date(1990, 1, 1), 'score': 200},
+    ] == list(results)
+
+def test_iter_select_close(engine):
+    tbl = Table("populated", bind=engine)
+    results = tbl.iter_select()
+    assert next(results) == {'id': 'a', 'name': 'Jack', 'birth_date': date(2000, 1, 1), 'score': 100}
+    results.close()
+    with pytest.raises(StopIteration):
+        next(results)
+
+def test_select_raw_with_table(engine):
+    tbl = Table("populated", bind=engine)
+    results = tbl.select("SELECT birth_date, score * 2 AS double_score FROM populated WHERE name = 'Jack'")
+    assert [
+        {'birth_date': date(2000, 1, 1), 'double_score': 200},
+    ] == results
@@ -145,3 +145,14 @@ def test_create_list(engine):
         {'cid': 1, 'name': 'mycol_2', 'type': 'INTEGER', 'notnull': 1, 'dflt_value': None, 'pk': 0},
         {'cid': 2, 'name': 'mycol_3', 'type': 'DATE', 'notnull': 0, 'dflt_value': None, 'pk': 0},
     ] == list(res)
+
+def test_create_after_select(engine):
+    tbl = Table("mytable", bind=engine)
+    tbl.create({"mycol_1": str})
+    tbl.insert({"mycol_1": "a"})
+    assert tbl.select() == [{"mycol_1": "a"}]
+
+    tbl.drop()
+    tbl.create({"mycol_1": str, "mycol_2": int})
+    tbl.insert({"mycol_1": "b", "mycol_2": 1})
+    assert tbl.select() == [{"mycol_1": "b", "mycol_2": 1}]
@@ -36,3 +36,119 @@ def test_count_where(engine):
     assert count({"name": "Johnz"}, table="populated", bind=engine) == 0
 
 
+
+@pytest.mark.parametrize("type_,value,expected", [
+    ("String", "a", "a"),
+    ("String", 1, "1"),
+    ("Integer", 1, 1),
+    ("Integer", "1", 1),
+    ("Boolean", True, True),
+    ("Date", "2022-12-31", date(2022, 12, 31)),
+    ("Date", date(2022, 12, 31), date(2022, 12, 31)),
+    ("DateTime", "2022-12-31 12:00:00", datetime(2022, 12, 31, 12, 0, 0)),
+    ("DateTime", datetime(2022, 12, 31, 12, 0, 0), datetime(2022, 12, 31, 12, 0, 0)),
+    ("Integer", None, None),
+])
+def test_converter(type_, value, expected):
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    from redbird.sql.expressions import to_native, _get_converter
+    sql_type = getattr(sqlalchemy, type_)()
+    conv = _get_converter(sql_type, nullable=True)
+    assert conv(value) == expected
+    assert to_native(value, sql_type=sql_type, nullable=True) == expected
+
+def test_to_expression():
+    pytest.importorskip("sqlalchemy")
+    from redbird.sql.expressions import to_expression
+    from redbird.oper import greater_than, skip
+    expr = to_expression({"col_1": "a", "col_2": greater_than(1), "col_3": skip, "col_4": between(1, 2)})
+    assert str(expr) == "col_1 = :col_1_1 AND col_2 > :col_2_1 AND col_4 BETWEEN :col_4_1 AND :col_4_2"
+
+@pytest.mark.parametrize("dialect,expected", [
+    ("sqlite", "col_1 IN (__[POSTCOMPILE_col_1_1])"),
+    ("postgresql", "col_1 = ANY (%(param_1)s)"),
+])
+def test_to_expression_in(dialect, expected):
+    pytest.importorskip("sqlalchemy")
+    from sqlalchemy.dialects import sqlite, postgresql
+    from redbird.sql.expressions import to_expression
+    from redbird.oper import in_
+    expr = to_expression({"col_1": in_(["a", "b"])}, dialect=dialect)
+    sql_dialect = {"sqlite": sqlite, "postgresql": postgresql}[dialect].dialect()
+    assert str(expr.compile(dialect=sql_dialect)) == expected
+
+def test_to_expression_empty():
+    pytest.importorskip("sqlalchemy")
+    from redbird.sql.expressions import to_expression
+    from redbird.oper import skip
+    assert to_expression({}) is None
+    assert to_expression({"col_1": skip, "col_2": slice(None, None)}) is None
+
+def test_count_all(engine):
+    assert count({}, table="populated", bind=engine) == 3
+
+@pytest.mark.parametrize("dialect", ["sqlite", "postgresql", "mysql"])
+def test_converter_date(dialect):
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    from redbird.sql.expressions import _get_converter, _identity
+    conv = _get_converter(sqlalchemy.Date(), nullable=True, dialect=dialect)
+    if dialect == "sqlite":
+        assert conv("2022-12-31") == date(2022, 12, 31)
+    else:
+        assert conv is _identity
+    assert conv(date(2022, 12, 31)) == date(2022, 12, 31)
+
+@pytest.mark.parametrize("sql,expected", [
+    ("SELECT name FROM populated WHERE score = 100", [("Jack",)]),
+    ("SELECT name FROM populated WHERE name LIKE 'J%k'", [("Jack",)]),
+    ("SELECT name FROM populated WHERE birth_date < '1995-01-01 00:00:00'", [("John",)]),
+])
+def test_execute_raw(engine, sql, expected):
+    with Table(None, bind=engine).execution(sql) as results:
+        assert list(results) == expected
+
+@pytest.mark.parametrize("sql,expected", [
+    ("SELECT * FROM populated", True),
+    ("SELECT * FROM populated WHERE name = 'Jack'", True),
+    ("SELECT * FROM populated WHERE name = :name", False),
+    ("SELECT * FROM populated WHERE name = %s", False),
+    ("SELECT * FROM populated WHERE name = %(name)s", False),
+    ("SELECT * FROM populated WHERE name LIKE 'J%'", False),
+    ("SELECT * FROM populated WHERE birth_date < '2000-01-01 00:00:00'", False),
+])
+def test_is_driver_sql(sql, expected):
+    from redbird.sql.expressions import _is_driver_sql
+    assert _is_driver_sql(sql) is expected
+
+@pytest.mark.parametrize("sql,parameters,is_driver_sql", [
+    ("SELECT name FROM populated WHERE score = 100", None, True),
+    ("SELECT name FROM populated WHERE name LIKE 'J%k'", None, False),
+    ("SELECT name FROM populated WHERE name = :name", {"name": "Jack"}, False),
+])
+def test_select_raw_execution_path(engine, monkeypatch, sql, parameters, is_driver_sql):
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    calls = []
+    exec_driver_sql = sqlalchemy.engine.Connection.exec_driver_sql
+    def mock_exec_driver_sql(self, *args, **kwargs):
+        calls.append(args[0])
+        return exec_driver_sql(self, *args, **kwargs)
+    monkeypatch.setattr(sqlalchemy.engine.Connection, "exec_driver_sql", mock_exec_driver_sql)
+
+    results = select(sql, bind=engine, parameters=parameters)
+    assert list(results) == [{"name": "Jack"}]
+    assert calls == ([sql] if is_driver_sql else [])
+
+def test_oper_builder():
+    pytest.importorskip("sqlalchemy")
+    from redbird.sql.expressions import _get_oper_builder, _OPER_BUILDERS, _OPER_BUILDER_CACHE
+    from redbird.oper import In, GreaterThan, greater_than
+
+    class MyIn(In):
+        pass
+
+    assert _get_oper_builder(MyIn(["a"])) is _OPER_BUILDERS[In]
+    assert _OPER_BUILDER_CACHE[MyIn] is _OPER_BUILDERS[In]
+
+    assert _get_oper_builder(greater_than(1)) is None
+    assert GreaterThan in _OPER_BUILDER_CACHE
+    assert _OPER_BUILDER_CACHE[GreaterThan] is None